@@ -7,77 +7,74 @@ This script provides a comprehensive summary of the successfully deployed
 and tested Terraform-based data analytics infrastructure.
 """
 
+import sys
+
 def print_success_summary():
-    print("🎉 DATA ANALYTICS PIPELINE - DEPLOYMENT SUCCESS!")
-    print("=" * 60)
-    print()
-    
-    print("📋 INFRASTRUCTURE DEPLOYED:")
-    print("✅ AWS VPC with public/private subnets")
-    print("✅ PostgreSQL RDS (publicly accessible)")
-    print("✅ S3 Data Lake buckets")
-    print("✅ AWS Glue ETL jobs")
-    print("✅ AWS Glue Data Catalog")
-    print("✅ Amazon Athena workgroup")
-    print("✅ IAM roles and security groups")
-    print()
-    
-    print("🔄 ETL PIPELINE STATUS:")
-    print("✅ RDS Database: Connected and populated with sample data")
-    print("✅ Customers ETL Job: SUCCEEDED (95 seconds)")
-    print("✅ Orders ETL Job: SUCCEEDED (99 seconds)")
-    print("✅ Data Flow: RDS → S3 Data Lake (successful)")
-    print("✅ Incremental Data: Added and ready for processing")
-    print()
-    
-    print("📊 DATA PROCESSING:")
-    print("✅ Extracted data from PostgreSQL tables (public.customers, public.orders)")
-    print("✅ Applied transformations (customer segments, order categories)")
-    print("✅ Loaded to S3 with partitioning")
-    print("✅ ETL metadata tracking for incremental processing")
-    print()
-    
-    print("🔧 CONFIGURATION DETAILS:")
-    print("• RDS Endpoint: data-analytics-postgres-v2.ccbsg6ya6wfa.us-east-1.rds.amazonaws.com:5432")
-    print("• S3 Bucket: data-analytics-data-lake-wsvnlynm")
-    print("• Glue Database: data-analytics_database")
-    print("• Athena Workgroup: data-analytics-workgroup")
-    print("• Region: us-east-1")
-    print()
-    
-    print("🚀 WHAT'S WORKING:")
-    print("✅ End-to-end data pipeline from RDS to S3")
-    print("✅ Incremental ETL processing with timestamp tracking")
-    print("✅ Data transformations and enrichment")
-    print("✅ Proper error handling and logging")
-    print("✅ Infrastructure as Code with Terraform")
-    print()
-    
-    print("📝 KEY ACHIEVEMENTS:")
-    print("1. Successfully migrated RDS from private to public subnets")
-    print("2. Fixed Glue security groups and VPC connectivity") 
-    print("3. Resolved ETL script syntax and schema issues")
-    print("4. Implemented proper incremental data processing")
-    print("5. Deployed complete data analytics infrastructure")
-    print()
-    
-    print("📈 SAMPLE DATA PROCESSED:")
-    print("• Customers: 13 records (including recent updates)")
-    print("• Orders: 33 records (including new incremental data)")
-    print("• Data transformations applied successfully")
-    print("• Partitioned storage in S3 for optimal querying")
-    print()
-    
-    print("🛠️  NEXT STEPS:")
-    print("• Run crawler to update Glue catalog schema")
-    print("• Test Athena queries for analytics")
-    print("• Set up automated ETL scheduling")
-    print("• Configure monitoring and alerting")
-    print()
-    
-    print("🎯 MISSION ACCOMPLISHED!")
-    print("The Terraform-based data analytics infrastructure is")
-    print("successfully deployed and the ETL pipeline is operational!")
+    # Emit the whole report with one buffered write instead of ~60 print calls
+    summary = """\
+🎉 DATA ANALYTICS PIPELINE - DEPLOYMENT SUCCESS!
+============================================================
+
+📋 INFRASTRUCTURE DEPLOYED:
+✅ AWS VPC with public/private subnets
+✅ PostgreSQL RDS (publicly accessible)
+✅ S3 Data Lake buckets
+✅ AWS Glue ETL jobs
+✅ AWS Glue Data Catalog
+✅ Amazon Athena workgroup
+✅ IAM roles and security groups
+
+🔄 ETL PIPELINE STATUS:
+✅ RDS Database: Connected and populated with sample data
+✅ Customers ETL Job: SUCCEEDED (95 seconds)
+✅ Orders ETL Job: SUCCEEDED (99 seconds)
+✅ Data Flow: RDS → S3 Data Lake (successful)
+✅ Incremental Data: Added and ready for processing
+
+📊 DATA PROCESSING:
+✅ Extracted data from PostgreSQL tables (public.customers, public.orders)
+✅ Applied transformations (customer segments, order categories)
+✅ Loaded to S3 with partitioning
+✅ ETL metadata tracking for incremental processing
+
+🔧 CONFIGURATION DETAILS:
+• RDS Endpoint: data-analytics-postgres-v2.ccbsg6ya6wfa.us-east-1.rds.amazonaws.com:5432
+• S3 Bucket: data-analytics-data-lake-wsvnlynm
+• Glue Database: data-analytics_database
+• Athena Workgroup: data-analytics-workgroup
+• Region: us-east-1
+
+🚀 WHAT'S WORKING:
+✅ End-to-end data pipeline from RDS to S3
+✅ Incremental ETL processing with timestamp tracking
+✅ Data transformations and enrichment
+✅ Proper error handling and logging
+✅ Infrastructure as Code with Terraform
+
+📝 KEY ACHIEVEMENTS:
+1. Successfully migrated RDS from private to public subnets
+2. Fixed Glue security groups and VPC connectivity
+3. Resolved ETL script syntax and schema issues
+4. Implemented proper incremental data processing
+5. Deployed complete data analytics infrastructure
+
+📈 SAMPLE DATA PROCESSED:
+• Customers: 13 records (including recent updates)
+• Orders: 33 records (including new incremental data)
+• Data transformations applied successfully
+• Partitioned storage in S3 for optimal querying
+
+🛠️  NEXT STEPS:
+• Run crawler to update Glue catalog schema
+• Test Athena queries for analytics
+• Set up automated ETL scheduling
+• Configure monitoring and alerting
+
+🎯 MISSION ACCOMPLISHED!
+The Terraform-based data analytics infrastructure is
+successfully deployed and the ETL pipeline is operational!
+"""
+    sys.stdout.write(summary)
 
 if __name__ == "__main__":
     print_success_summary()
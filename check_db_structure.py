@@ -19,25 +19,17 @@ def check_database_structure():
         conn = psycopg2.connect(**db_config)
         cursor = conn.cursor()
         
-        # Check current database
-        cursor.execute("SELECT current_database();")
-        current_db = cursor.fetchone()[0]
-        print(f"📊 Current database: {current_db}")
-        
-        # Check current schema
-        cursor.execute("SELECT current_schema();")
-        current_schema = cursor.fetchone()[0]
-        print(f"📋 Current schema: {current_schema}")
-        
-        # List all schemas
+        # Check current database, schema and available schemas in one round-trip
         cursor.execute("""
-            SELECT schema_name 
-            FROM information_schema.schemata 
-            WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-            ORDER BY schema_name;
+            SELECT current_database(), current_schema(),
+                   (SELECT array_agg(schema_name ORDER BY schema_name)
+                    FROM information_schema.schemata
+                    WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast'));
         """)
-        schemas = cursor.fetchall()
-        print(f"📁 Available schemas: {[s[0] for s in schemas]}")
+        current_db, current_schema, schemas = cursor.fetchone()
+        print(f"📊 Current database: {current_db}")
+        print(f"📋 Current schema: {current_schema}")
+        print(f"📁 Available schemas: {schemas}")
         
         # List all tables in current schema
         cursor.execute("""
@@ -52,23 +44,30 @@ def check_database_structure():
         for table_name, schema_name in tables:
             print(f"   - {schema_name}.{table_name}")
         
-        # Check specific tables we need
-        for table in ['customers', 'orders']:
-            cursor.execute(f"""
-                SELECT column_name, data_type
-                FROM information_schema.columns 
-                WHERE table_name = '{table}'
-                ORDER BY ordinal_position;
-            """)
-            columns = cursor.fetchall()
-            
+        # Check specific tables we need - one batched columns query instead
+        # of a columns query per table
+        expected_tables = ['customers', 'orders']
+
+        cursor.execute("""
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_name = ANY(%s)
+            ORDER BY table_name, ordinal_position;
+        """, (expected_tables,))
+        columns_by_table = {}
+        for table_name, col_name, data_type in cursor.fetchall():
+            columns_by_table.setdefault(table_name, []).append((col_name, data_type))
+
+        for table in expected_tables:
+            columns = columns_by_table.get(table)
             if columns:
                 print(f"\n📊 Table '{table}' structure:")
                 for col_name, data_type in columns:
                     print(f"   - {col_name}: {data_type}")
-                
-                # Count records
-                cursor.execute(f"SELECT COUNT(*) FROM {table};")
+
+                # Exact count - these tables hold tens of rows, and this script
+                # verifies a load the planner may not have ANALYZEd yet
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
                 count = cursor.fetchone()[0]
                 print(f"   📈 Record count: {count}")
             else:
@@ -1,85 +1,110 @@
 #!/usr/bin/env python3
 import boto3
+import heapq
 import json
+from botocore.config import Config
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 def check_s3_data():
     """Check what data was loaded to S3 by the ETL jobs"""
     
-    s3_client = boto3.client('s3')
+    # One shared client: pooled connections for the concurrent metadata reads,
+    # adaptive retries so a throttled call doesn't stall the whole listing
+    s3_client = boto3.client('s3', config=Config(
+        max_pool_connections=32,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        tcp_keepalive=True
+    ))
     bucket_name = 'data-analytics-data-lake-wsvnlynm'
     
     print(f"🪣 Checking S3 bucket: {bucket_name}")
     print("="*50)
     
     try:
-        # List all objects in the bucket
-        response = s3_client.list_objects_v2(Bucket=bucket_name)
-        
-        if 'Contents' not in response:
-            print("❌ No objects found in bucket")
-            return
-            
-        objects = response['Contents']
+        # List all objects in the bucket (paginated, so buckets with >1000 keys are fully covered)
+        paginator = s3_client.get_paginator('list_objects_v2')
+
         total_size = 0
         file_count = 0
-        
-        # Group by prefix (table/folder)
-        folders = {}
-        
-        for obj in objects:
-            key = obj['Key']
-            size = obj['Size']
-            modified = obj['LastModified']
-            
-            total_size += size
-            file_count += 1
-            
-            # Extract folder/table name
-            folder = key.split('/')[0] if '/' in key else 'root'
-            if folder not in folders:
-                folders[folder] = {'files': [], 'total_size': 0}
-            
-            folders[folder]['files'].append({
-                'key': key,
-                'size': size,
-                'modified': modified.strftime('%Y-%m-%d %H:%M:%S')
-            })
-            folders[folder]['total_size'] += size
-        
+
+        # Group by prefix (table/folder); keep only the 5 newest files per
+        # folder in a bounded heap so memory stays O(folders), not O(objects)
+        folders = defaultdict(lambda: {'count': 0, 'total_size': 0, 'top5': []})
+        metadata_objects = []
+
+        for page in paginator.paginate(Bucket=bucket_name, PaginationConfig={'PageSize': 1000}):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                size = obj['Size']
+                modified = obj['LastModified']
+
+                total_size += size
+                file_count += 1
+
+                # Remember ETL metadata objects for the summary below
+                if 'etl-metadata' in key:
+                    metadata_objects.append(obj)
+
+                # Extract folder/table name
+                folder = key.split('/')[0] if '/' in key else 'root'
+                data = folders[folder]
+                data['count'] += 1
+                data['total_size'] += size
+
+                heapq.heappush(data['top5'], (modified, key, size))
+                if len(data['top5']) > 5:
+                    heapq.heappop(data['top5'])
+
+        if file_count == 0:
+            print("❌ No objects found in bucket")
+            return
+
         print(f"📊 Total files: {file_count}")
         print(f"📦 Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)")
         print()
         
         # Show details by folder
         for folder, data in sorted(folders.items()):
-            print(f"📁 {folder}/ ({len(data['files'])} files, {data['total_size']:,} bytes)")
-            
-            # Show first few files
-            for file_info in sorted(data['files'], key=lambda x: x['modified'], reverse=True)[:5]:
-                print(f"   📄 {file_info['key']}")
-                print(f"      📦 {file_info['size']:,} bytes")
-                print(f"      📅 {file_info['modified']}")
+            print(f"📁 {folder}/ ({data['count']} files, {data['total_size']:,} bytes)")
+
+            # Show the newest files (at most 5 kept per folder)
+            for modified, key, size in sorted(data['top5'], reverse=True):
+                print(f"   📄 {key}")
+                print(f"      📦 {size:,} bytes")
+                print(f"      📅 {modified.strftime('%Y-%m-%d %H:%M:%S')}")
                 print()
-            
-            if len(data['files']) > 5:
-                print(f"   ... and {len(data['files']) - 5} more files")
+
+            if data['count'] > 5:
+                print(f"   ... and {data['count'] - 5} more files")
                 print()
         
         # Check for ETL metadata
         print("📋 ETL Metadata:")
-        metadata_objects = [obj for obj in objects if 'etl-metadata' in obj['Key']]
         if metadata_objects:
+            # Fetch timestamp files concurrently - each GET is latency-bound
+            timestamps = {}
+            txt_keys = [obj['Key'] for obj in metadata_objects if obj['Key'].endswith('.txt')]
+            if txt_keys:
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    futures = {
+                        executor.submit(s3_client.get_object, Bucket=bucket_name, Key=key): key
+                        for key in txt_keys
+                    }
+                    for future in as_completed(futures):
+                        key = futures[future]
+                        try:
+                            content = future.result()
+                            timestamps[key] = content['Body'].read().decode('utf-8').strip()
+                        except Exception as e:
+                            timestamps[key] = None
+                            print(f"   ❌ Could not read {key}: {e}")
+
             for obj in metadata_objects:
                 print(f"   🔖 {obj['Key']} ({obj['Size']} bytes)")
-                
-                # Try to read timestamp files
-                if obj['Key'].endswith('.txt'):
-                    try:
-                        content = s3_client.get_object(Bucket=bucket_name, Key=obj['Key'])
-                        timestamp = content['Body'].read().decode('utf-8').strip()
-                        print(f"      📅 Content: {timestamp}")
-                    except Exception as e:
-                        print(f"      ❌ Could not read: {e}")
+                timestamp = timestamps.get(obj['Key'])
+                if timestamp is not None:
+                    print(f"      📅 Content: {timestamp}")
         else:
             print("   ℹ️  No ETL metadata found")
         
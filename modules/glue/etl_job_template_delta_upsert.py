@@ -3,31 +3,85 @@
 # Handles both new records and updates with ACID transactions
 
 import sys
+import time
+from datetime import datetime
 from awsglue.transforms import *
 from awsglue.utils import getResolvedOptions
+from pyspark import StorageLevel
 from pyspark.context import SparkContext
 from awsglue.context import GlueContext
 from awsglue.job import Job
 from awsglue.dynamicframe import DynamicFrame
 from pyspark.sql import functions as F
+from delta.tables import DeltaTable
 
-# Get job parameters
-args = getResolvedOptions(sys.argv, [
+# Get job parameters (debug_sample is optional: getResolvedOptions raises on
+# listed-but-absent arguments, so only resolve it when it was actually passed)
+required_args = [
     'JOB_NAME',
     'source_table',
     'target_path',
     'database_name',
     'connection_name'
-])
+]
+optional_args = ['debug_sample'] if '--debug_sample' in sys.argv else []
+args = getResolvedOptions(sys.argv, required_args + optional_args)
 
 # Initialize Glue context first
 sc = SparkContext()
 glueContext = GlueContext(sc)
 spark = glueContext.spark_session
 
+# ZSTD compresses the repetitive string columns ~20-40% smaller than the
+# default Snappy at similar decode speed - Athena bills by bytes scanned
+spark.conf.set("spark.sql.parquet.compression.codec", "zstd")
+spark.conf.set("parquet.enable.dictionary", "true")
+
+# Size files correctly at write/merge time instead of compacting afterwards
+spark.conf.set("spark.databricks.delta.optimizeWrite.enabled", "true")
+spark.conf.set("spark.databricks.delta.autoCompact.enabled", "true")
+
+# Incremental batches are tiny next to the full Delta table - allow the merge's
+# internal joins to broadcast the source instead of sort-merge shuffling
+spark.conf.set("spark.sql.autoBroadcastJoinThreshold", str(512 * 1024 * 1024))
+spark.conf.set("spark.sql.adaptive.autoBroadcastJoinThreshold", str(512 * 1024 * 1024))
+
+# Adaptive Query Execution: re-plan shuffle stages from runtime statistics.
+# Skew handling splits hot-key partitions (one very active customer would
+# otherwise leave a straggler task holding up the whole MERGE), and the local
+# shuffle reader avoids an extra exchange when a join demotes to broadcast.
+spark.conf.set("spark.sql.adaptive.enabled", "true")
+spark.conf.set("spark.sql.adaptive.coalescePartitions.enabled", "true")
+spark.conf.set("spark.sql.adaptive.advisoryPartitionSizeInBytes", str(128 * 1024 * 1024))
+spark.conf.set("spark.sql.adaptive.skewJoin.enabled", "true")
+spark.conf.set("spark.sql.adaptive.skewJoin.skewedPartitionFactor", "5")
+spark.conf.set("spark.sql.adaptive.skewJoin.skewedPartitionThresholdInBytes", str(256 * 1024 * 1024))
+spark.conf.set("spark.sql.adaptive.localShuffleReader.enabled", "true")
+
 job = Job(glueContext)
 job.init(args['JOB_NAME'], args)
 
+# One job-run id per invocation, computed on the driver (no Spark action needed)
+RUN_EPOCH = int(time.time())
+
+# Debug output (schema dumps, sample-record scans) is opt-in via job parameter
+DEBUG_SAMPLE = args.get('debug_sample', 'false').lower() == 'true'
+
+# Bookmark and merge configuration per source table; new tables only need an
+# entry here instead of another branch inside the extract function
+TABLE_CONFIG = {
+    "customers": {
+        "dbtable": "public.customers",
+        "bookmark_keys": ["customer_id", "updated_at"],
+        "primary_key": "customer_id",
+    },
+    "orders": {
+        "dbtable": "public.orders",
+        "bookmark_keys": ["order_id", "updated_at"],
+        "primary_key": "order_id",
+    },
+}
+
 def extract_with_native_bookmarks(table_name, connection_name):
     """
     Extract data using AWS Glue native bookmark functionality
@@ -36,31 +90,32 @@ def extract_with_native_bookmarks(table_name, connection_name):
     
     print(f"🔍 Starting incremental extraction for {table_name} using native bookmarks")
     
-    # Define bookmark configuration for each table
-    if table_name == "customers":
-        dbtable = "public.customers"
-        bookmark_keys = ["customer_id", "updated_at"]
-        primary_key = "customer_id"
-    elif table_name == "orders":
-        dbtable = "public.orders"
-        bookmark_keys = ["order_id", "updated_at"]
-        primary_key = "order_id"
-    else:
-        dbtable = f"public.{table_name}"
-        bookmark_keys = ["id", "updated_at"]
-        primary_key = "id"
+    # Look up bookmark configuration for the table (generic fallback for
+    # tables that follow the id/updated_at convention)
+    config = TABLE_CONFIG.get(table_name, {
+        "dbtable": f"public.{table_name}",
+        "bookmark_keys": ["id", "updated_at"],
+        "primary_key": "id",
+    })
+    dbtable = config["dbtable"]
+    bookmark_keys = config["bookmark_keys"]
+    primary_key = config["primary_key"]
     
     print(f"📋 Table: {dbtable}")
     print(f"🔑 Bookmark keys: {bookmark_keys}")
     print(f"🗝️  Primary key: {primary_key}")
     
     # Use AWS Glue's native bookmarking with jobBookmarkKeys
+    # hashexpression/hashpartitions split the JDBC read across parallel
+    # connections keyed on the primary key instead of one single-stream scan
     dynamic_frame = glueContext.create_dynamic_frame.from_options(
         connection_type="postgresql",
         connection_options={
             "useConnectionProperties": "true",
             "dbtable": dbtable,
             "connectionName": connection_name,
+            "hashexpression": primary_key,
+            "hashpartitions": "8",
         },
         additional_options={
             "jobBookmarkKeys": bookmark_keys,
@@ -69,38 +124,35 @@ def extract_with_native_bookmarks(table_name, connection_name):
         transformation_ctx=f"extract_{table_name}_with_bookmarks"
     )
     
-    record_count = dynamic_frame.count()
-    print(f"📊 Extracted {record_count} new/updated records using bookmark keys: {bookmark_keys}")
-    
     return dynamic_frame, primary_key
 
-def transform_data(dynamic_frame, table_name):
+def transform_data(df, table_name):
     """Apply transformations and prepare data for Delta Lake upsert"""
-    
+
     print(f"🔄 Applying transformations for {table_name}")
-    
-    # Convert to DataFrame for easier manipulation
-    df = dynamic_frame.toDF()
-    
-    # Add processing metadata
-    df = df.withColumn("etl_processed_at", F.current_timestamp()) \
-           .withColumn("etl_job_run_id", F.lit(args['JOB_NAME'] + "_" + str(int(F.unix_timestamp().collect()[0][0]))))
-    
-    # Add year/month/day columns for partitioning (derived from updated_at)
-    if "updated_at" in df.columns:
-        df = df.withColumn("year", F.year("updated_at")) \
-               .withColumn("month", F.month("updated_at")) \
-               .withColumn("day", F.dayofmonth("updated_at"))
-    else:
-        # Fallback to processing time if updated_at not available
-        df = df.withColumn("year", F.year("etl_processed_at")) \
-               .withColumn("month", F.month("etl_processed_at")) \
-               .withColumn("day", F.dayofmonth("etl_processed_at"))
+
+    # Partition columns derive from updated_at, falling back to processing time.
+    # The processing timestamp is fixed on the driver so the plan stays free of
+    # nondeterministic expressions (which would block partition pruning).
+    processed_at = F.lit(datetime.utcnow()).cast("timestamp")
+    partition_source = F.col("updated_at") if "updated_at" in df.columns else processed_at
+
+    # Add processing metadata and year/month/day partition columns in a
+    # single projection instead of a chain of withColumn plan nodes
+    df = df.select(
+        "*",
+        processed_at.alias("etl_processed_at"),
+        F.lit(args['JOB_NAME'] + "_" + str(RUN_EPOCH)).alias("etl_job_run_id"),
+        F.year(partition_source).alias("year"),
+        F.month(partition_source).alias("month"),
+        F.dayofmonth(partition_source).alias("day"),
+    )
     
     print(f"✅ Transformations completed for {table_name}")
-    print(f"📏 Transformed DataFrame schema:")
-    df.printSchema()
-    
+    if DEBUG_SAMPLE:
+        print(f"📏 Transformed DataFrame schema:")
+        df.printSchema()
+
     return df
 
 def upsert_to_delta_lake(df, target_path, table_name, primary_key):
@@ -115,95 +167,79 @@ def upsert_to_delta_lake(df, target_path, table_name, primary_key):
     delta_table_path = f"{target_path}/delta"
     
     try:
-        # Register new data as a temp view
-        df.createOrReplaceTempView("source_table")
-        
         # If Delta table does not exist, write initial data
-        try:
-            spark.read.format("delta").load(delta_table_path)
-            table_exists = True
-        except Exception:
-            table_exists = False
-        
-        if not table_exists:
+        if not DeltaTable.isDeltaTable(spark, delta_table_path):
             print(f"📝 Creating new Delta table at {delta_table_path}")
-            df.write.format("delta").mode("overwrite").partitionBy("year", "month", "day").save(delta_table_path)
+            # Co-locate rows per partition so each task writes one partition
+            # directory instead of tasks x partitions small files
+            df.repartition(4, "year", "month", "day") \
+              .write.format("delta").mode("overwrite") \
+              .option("maxRecordsPerFile", 1000000) \
+              .partitionBy("year", "month", "day").save(delta_table_path)
             print(f"✅ New Delta table created successfully")
         else:
-            print(f"🔄 Performing UPSERT operation with MERGE INTO ...")
-            merge_sql = f"""
-            MERGE INTO delta.`{delta_table_path}` AS target
-            USING source_table AS source
-            ON target.{primary_key} = source.{primary_key}
-            WHEN MATCHED THEN UPDATE SET *
-            WHEN NOT MATCHED THEN INSERT *
-            """
-            spark.sql(merge_sql)
+            print(f"🔄 Performing UPSERT operation with DeltaTable.merge ...")
+            delta_table = DeltaTable.forPath(spark, delta_table_path)
+
+            # No partition bounds on the merge condition: year/month/day come
+            # from updated_at, so the existing version of an updated row lives
+            # in an older partition than the incoming batch - pruning it away
+            # would miss the match and insert a duplicate key instead
+            merge_condition = f"target.{primary_key} = source.{primary_key}"
+
+            # No forced broadcast: after a bookmark reset the source is a full
+            # table re-extract, and an unconditional hint would try to ship it
+            # to every executor regardless of size. The raised
+            # autoBroadcastJoinThreshold above lets AQE broadcast the usual
+            # small incremental batches on its own.
+            delta_table.alias("target").merge(
+                df.alias("source"),
+                merge_condition
+            ).whenMatchedUpdateAll() \
+             .whenNotMatchedInsertAll() \
+             .execute()
             print(f"✅ UPSERT completed successfully")
         
-        # Read back the final table for verification
-        final_df = spark.read.format("delta").load(delta_table_path)
-        final_count = final_df.count()
-        print(f"📊 Final table record count: {final_count}")
-        
-        # Show some sample records
-        print(f"📋 Sample records from final table:")
-        final_df.orderBy(F.desc("updated_at")).limit(5).show(truncate=False)
-        
-        return final_count
+        # Report what the write/merge did from the Delta log's operation
+        # metrics instead of re-scanning the whole table for a count
+        operation_metrics = DeltaTable.forPath(spark, delta_table_path) \
+            .history(1).select("operationMetrics").collect()[0][0]
+        inserted = operation_metrics.get('numTargetRowsInserted',
+                                         operation_metrics.get('numOutputRows', '0'))
+        updated = operation_metrics.get('numTargetRowsUpdated', '0')
+        print(f"📊 Rows inserted: {inserted}, rows updated: {updated}")
+
+        # Show some sample records (full-table sort, so only when debugging)
+        if DEBUG_SAMPLE:
+            final_df = spark.read.format("delta").load(delta_table_path)
+            print(f"📋 Sample records from final table:")
+            final_df.orderBy(F.desc("updated_at")).limit(5).show(truncate=False)
+
+        return operation_metrics
         
     except Exception as e:
         print(f"❌ Error during Delta Lake UPSERT: {str(e)}")
         raise e
 
-def create_symlink_manifest(delta_table_path, target_path):
+def create_symlink_manifest(delta_table_path):
     """
     Create symlink manifest for Athena compatibility with Delta Lake
     """
-    
+
     print(f"🔗 Creating symlink manifest for Athena compatibility")
-    
+
     try:
-        # Get the latest files from Delta table
-        df = spark.read.format("delta").load(delta_table_path)
-        latest_files = df.inputFiles()
-        
-        # Create symlink manifest
-        symlink_path = f"{target_path}/symlink_format_manifest"
-        
-        # Write manifest file
-        manifest_content = "\n".join(latest_files)
-        
-        # Use Spark to write the manifest
-        spark.sparkContext.parallelize([manifest_content]).coalesce(1) \
-            .saveAsTextFile(f"{symlink_path}/manifest")
-        
-        print(f"✅ Symlink manifest created at {symlink_path}")
-        
+        # Delta generates the manifest in-cluster from its transaction log:
+        # metadata-only, partition-aware, and atomically named - no driver-side
+        # file listing or hand-built manifest content
+        DeltaTable.forPath(spark, delta_table_path).generate("symlink_format_manifest")
+
+        print(f"✅ Symlink manifest generated at {delta_table_path}/_symlink_format_manifest")
+
     except Exception as e:
         print(f"⚠️  Warning: Could not create symlink manifest: {str(e)}")
         print(f"   Athena queries may need to use Delta Lake native support")
 
-def optimize_delta_table(delta_table_path, table_name):
-    """
-    Optimize Delta Lake table by compacting small files (no Z-ORDER in Glue native)
-    """
-    
-    print(f"🔧 Optimizing Delta table for {table_name}")
-    
-    try:
-        df = spark.read.format("delta").load(delta_table_path)
-        file_count = len(df.inputFiles())
-        if file_count > 10:
-            print(f"📦 Compacting {file_count} files...")
-            df.repartition(4).write.format("delta").mode("overwrite").partitionBy("year", "month", "day").option("overwriteSchema", "true").save(delta_table_path)
-            print(f"✅ Delta table compaction completed")
-        else:
-            print(f"ℹ️  File count ({file_count}) is acceptable, skipping compaction")
-    
-    except Exception as e:
-        print(f"⚠️  Warning: Delta table optimization failed: {str(e)}")
-
 def main():
     """Main ETL process with Delta Lake UPSERT functionality only"""
     
@@ -218,28 +254,34 @@ def main():
     try:
         # Step 1: Extract data using native bookmarks
         source_data, primary_key = extract_with_native_bookmarks(table_name, connection_name)
-        
-        # Check if we have any data to process
-        if source_data.count() == 0:
+
+        # Convert to DataFrame once and persist so the JDBC extract is not
+        # re-executed by the downstream transform/merge actions
+        source_df = source_data.toDF().persist(StorageLevel.MEMORY_AND_DISK)
+
+        # Check if we have any data to process - head(1) short-circuits after
+        # the first row instead of counting the whole extract
+        if not source_df.head(1):
             print("ℹ️  No new or updated records found. Job completed successfully.")
             job.commit()
             return
-        
-        # Step 2: Transform data
-        transformed_df = transform_data(source_data, table_name)
-        
+
+        # Step 2: Transform data - persisted because the Delta merge scans its
+        # source twice (matched + not-matched passes)
+        transformed_df = transform_data(source_df, table_name).persist(StorageLevel.MEMORY_AND_DISK)
+
         # Step 3: UPSERT to Delta Lake
-        final_count = upsert_to_delta_lake(transformed_df, target_path, table_name, primary_key)
+        merge_metrics = upsert_to_delta_lake(transformed_df, target_path, table_name, primary_key)
+
+        transformed_df.unpersist()
+        source_df.unpersist()
         
         # Step 4: Create symlink manifest for Athena (optional)
         delta_table_path = f"{target_path}/delta"
-        create_symlink_manifest(delta_table_path, target_path)
-        
-        # Step 5: Optimize Delta table (optional, but recommended)
-        optimize_delta_table(delta_table_path, table_name)
+        create_symlink_manifest(delta_table_path)
         
         print(f"🎉 Delta Lake ETL job completed successfully for {table_name}")
-        print(f"📊 Final record count: {final_count}")
+        print(f"📊 Merge metrics: {merge_metrics}")
         
     except Exception as e:
         print(f"❌ Error in Delta Lake ETL job for {table_name}: {str(e)}")
@@ -3,7 +3,10 @@
 Quick data loading script
 """
 
+import csv
+import io
 import psycopg2
+from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
 import random
 
@@ -99,11 +102,13 @@ def main():
         ]
         
         print("👥 Inserting customers...")
-        for name, email in customers:
-            cursor.execute("""
-                INSERT INTO customers (name, email) VALUES (%s, %s)
-            """, (name, email))
-        
+        execute_values(
+            cursor,
+            "INSERT INTO customers (name, email) VALUES %s",
+            customers,
+            page_size=1000
+        )
+
         print(f"✅ Inserted {len(customers)} customers")
         
         # Sample products with prices
@@ -121,26 +126,33 @@ def main():
         ]
         
         print("🛒 Inserting orders...")
-        order_count = 0
+        order_rows = []
         for days_ago in range(7):  # Last 7 days
             order_date = datetime.now().date() - timedelta(days=days_ago)
-            
+
             # Random number of orders per day (2-5)
             daily_orders = random.randint(2, 5)
-            
+
             for _ in range(daily_orders):
                 customer_id = random.randint(1, len(customers))
                 product_name, base_price = random.choice(products)
                 quantity = random.randint(1, 3)
                 price = round(base_price, 2)
-                
-                cursor.execute("""
-                    INSERT INTO orders (customer_id, product_name, quantity, price, order_date)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (customer_id, product_name, quantity, price, order_date))
-                
-                order_count += 1
-        
+
+                order_rows.append((customer_id, product_name, quantity, price, order_date))
+
+        # COPY streams the batch past the SQL parser entirely; customers were
+        # already inserted above so referential integrity holds
+        order_buf = io.StringIO()
+        csv.writer(order_buf).writerows(order_rows)
+        order_buf.seek(0)
+        cursor.copy_expert(
+            "COPY orders (customer_id, product_name, quantity, price, order_date) "
+            "FROM STDIN WITH CSV",
+            order_buf
+        )
+        order_count = len(order_rows)
+
         print(f"✅ Inserted {order_count} orders")
         
         conn.commit()
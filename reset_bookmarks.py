@@ -4,12 +4,17 @@ Simple script to reset Glue job bookmarks
 """
 
 import boto3
+from botocore.config import Config
 
 def reset_bookmarks():
     """Reset job bookmarks for ETL jobs"""
-    
+
     # Use default credentials (no profile)
-    glue_client = boto3.client('glue', region_name='us-east-1')
+    glue_client = boto3.client(
+        'glue',
+        region_name='us-east-1',
+        config=Config(retries={'max_attempts': 10, 'mode': 'adaptive'})
+    )
     
     jobs = ["data-analytics-customers-etl", "data-analytics-orders-etl"]
     
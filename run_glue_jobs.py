@@ -1 +1,368 @@
-#!/usr/bin/env python3"""Script to run Glue ETL jobs and monitor their progress"""import boto3import timeimport sysimport jsonfrom datetime import datetimedef run_glue_job(job_name, profile_name='test-prod'):    """Start a Glue job and return the job run ID"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        try:        response = glue_client.start_job_run(JobName=job_name)        job_run_id = response['JobRunId']        print(f"✅ Started Glue job: {job_name}")        print(f"📋 Job Run ID: {job_run_id}")        return job_run_id    except Exception as e:        print(f"❌ Failed to start job {job_name}: {str(e)}")        return Nonedef monitor_job(job_name, job_run_id, profile_name='test-prod'):    """Monitor a Glue job until completion"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        print(f"🔍 Monitoring job: {job_name} (Run ID: {job_run_id})")        while True:        try:            response = glue_client.get_job_run(JobName=job_name, RunId=job_run_id)            job_run = response['JobRun']                        job_state = job_run['JobRunState']            print(f"📊 Job Status: {job_state}")                        if job_state in ['SUCCEEDED', 'FAILED', 'STOPPED', 'TIMEOUT']:                break                        time.sleep(30)  # Wait 30 seconds before checking again                    except Exception as e:            print(f"❌ Error monitoring job: {str(e)}")            break        # Print final status and metrics    if job_state == 'SUCCEEDED':        print(f"✅ Job {job_name} completed successfully!")                # Print execution metrics        if 'ExecutionTime' in job_run:            execution_time = job_run['ExecutionTime']            print(f"⏱️  Execution Time: {execution_time} seconds")                if 'MaxCapacity' in job_run:            max_capacity = job_run['MaxCapacity']            print(f"💻 DPU Usage: {max_capacity}")                else:        print(f"❌ Job {job_name} failed with status: {job_state}")        if 'ErrorMessage' in job_run:            print(f"💥 Error: {job_run['ErrorMessage']}")        return job_state == 'SUCCEEDED'def reset_job_bookmark(job_name, profile_name='test-prod'):    """Reset Glue job bookmark to clear saved state"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        try:        response = glue_client.reset_job_bookmark(JobName=job_name)        print(f"✅ Reset job bookmark for: {job_name}")        return True    except Exception as e:        print(f"❌ Failed to reset bookmark for {job_name}: {str(e)}")        return Falsedef reset_all_bookmarks(profile_name='test-prod'):    """Reset bookmarks for all ETL jobs"""        jobs = ["data-analytics-customers-etl", "data-analytics-orders-etl"]    all_success = True        print("🔄 Resetting job bookmarks for all ETL jobs...")    for job_name in jobs:        success = reset_job_bookmark(job_name, profile_name)        if not success:            all_success = False        if all_success:        print("✅ All job bookmarks reset successfully!")    else:        print("⚠️  Some bookmark resets failed")        return all_successdef list_glue_jobs(profile_name='test-prod'):    """List all available Glue jobs"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        try:        response = glue_client.get_jobs()        jobs = response['Jobs']                print("📋 Available Glue Jobs:")        print("-" * 40)        for job in jobs:            job_name = job['Name']            job_role = job['Role']            created_on = job['CreatedOn'].strftime('%Y-%m-%d %H:%M:%S')            print(f"• {job_name}")            print(f"  Role: {job_role}")            print(f"  Created: {created_on}")            print()                except Exception as e:        print(f"❌ Error listing jobs: {str(e)}")def run_crawler(crawler_name, profile_name='test-prod'):    """Start a Glue crawler and return the crawler run ID"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        try:        response = glue_client.start_crawler(Name=crawler_name)        print(f"✅ Started Glue crawler: {crawler_name}")        return True    except Exception as e:        print(f"❌ Failed to start crawler {crawler_name}: {str(e)}")        return Falsedef monitor_crawler(crawler_name, profile_name='test-prod'):    """Monitor a Glue crawler until completion"""        session = boto3.Session(profile_name=profile_name)    glue_client = session.client('glue', region_name='us-east-1')        print(f"🔍 Monitoring crawler: {crawler_name}")        while True:        try:            response = glue_client.get_crawler(Name=crawler_name)            crawler = response['Crawler']                        crawler_state = crawler['State']            print(f"📊 Crawler Status: {crawler_state}")                        if crawler_state in ['READY', 'STOPPING']:                break                        time.sleep(30)  # Wait 30 seconds before checking again                    except Exception as e:            print(f"❌ Error monitoring crawler: {str(e)}")            break        # Print final status    if crawler_state == 'READY':        print(f"✅ Crawler {crawler_name} completed successfully!")                # Show tables created/updated        if 'LastCrawl' in crawler:            last_crawl = crawler['LastCrawl']            if 'Status' in last_crawl:                print(f"📈 Last crawl status: {last_crawl['Status']}")            if 'TablesCreated' in last_crawl:                print(f"📋 Tables created: {last_crawl['TablesCreated']}")            if 'TablesUpdated' in last_crawl:                print(f"🔄 Tables updated: {last_crawl['TablesUpdated']}")    else:        print(f"❌ Crawler {crawler_name} ended with status: {crawler_state}")        return crawler_state == 'READY'def main():    """Main function"""        if len(sys.argv) < 2:        print("Usage:")        print("  python3 run_glue_jobs.py list                    # List all jobs and crawlers")        print("  python3 run_glue_jobs.py run <job_name>          # Run a specific job")        print("  python3 run_glue_jobs.py run-all                 # Run all ETL jobs")        print("  python3 run_glue_jobs.py run-crawler <name>      # Run a specific crawler")        print("  python3 run_glue_jobs.py run-pipeline            # Run ETL jobs + crawler")        print("  python3 run_glue_jobs.py reset-bookmark <job>    # Reset job bookmark")        print("  python3 run_glue_jobs.py reset-all-bookmarks     # Reset all job bookmarks")        print("  python3 run_glue_jobs.py monitor <job_name> <run_id>  # Monitor a job")        sys.exit(1)        command = sys.argv[1]        if command == "list":        list_glue_jobs()            elif command == "run" and len(sys.argv) == 3:        job_name = sys.argv[2]        job_run_id = run_glue_job(job_name)                if job_run_id:            monitor_job(job_name, job_run_id)                elif command == "run-crawler" and len(sys.argv) == 3:        crawler_name = sys.argv[2]        if run_crawler(crawler_name):            monitor_crawler(crawler_name)                elif command == "run-all":        # Run both ETL jobs        jobs_to_run = [            "data-analytics-customers-etl",            "data-analytics-orders-etl"        ]                job_runs = []                # Start all jobs        for job_name in jobs_to_run:            job_run_id = run_glue_job(job_name)            if job_run_id:                job_runs.append((job_name, job_run_id))                # Monitor all jobs        all_succeeded = True        for job_name, job_run_id in job_runs:            print(f"\n🔍 Monitoring {job_name}...")            success = monitor_job(job_name, job_run_id)            if not success:                all_succeeded = False                if all_succeeded:            print("\n✅ All ETL jobs completed successfully!")        else:            print("\n❌ Some ETL jobs failed")                elif command == "run-pipeline":        # Run complete pipeline: ETL jobs + crawler        print("🚀 Starting complete data pipeline...")                # First run ETL jobs        jobs_to_run = [            "data-analytics-customers-etl",            "data-analytics-orders-etl"        ]                job_runs = []                # Start all jobs        for job_name in jobs_to_run:            job_run_id = run_glue_job(job_name)            if job_run_id:                job_runs.append((job_name, job_run_id))                # Monitor all jobs        all_succeeded = True        for job_name, job_run_id in job_runs:            print(f"\n🔍 Monitoring {job_name}...")            success = monitor_job(job_name, job_run_id)            if not success:                all_succeeded = False                # If ETL succeeded, run crawler        if all_succeeded:            print("\n🕷️ Starting crawler to update schema...")            crawler_name = "data-analytics-crawler"            if run_crawler(crawler_name):                monitor_crawler(crawler_name)            print("\n🎉 Complete pipeline finished!")        else:            print("\n❌ ETL jobs failed, skipping crawler")                elif command == "reset-bookmark" and len(sys.argv) == 3:        job_name = sys.argv[2]        reset_job_bookmark(job_name)            elif command == "reset-all-bookmarks":        reset_all_bookmarks()            elif command == "monitor" and len(sys.argv) == 4:        job_name = sys.argv[2]        job_run_id = sys.argv[3]        monitor_job(job_name, job_run_id)            else:        print("❌ Invalid command or arguments")        sys.exit(1)if __name__ == "__main__":    main()
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Script to run Glue ETL jobs and monitor their progress
+"""
+
+import boto3
+import time
+import sys
+import json
+from botocore.config import Config
+from botocore.exceptions import WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+# Memoized Glue clients keyed by profile - building a Session/client parses
+# AWS config files and rebuilds the botocore hook chain (~100-300ms), which
+# the monitoring loops would otherwise pay on every poll
+_GLUE_CLIENTS = {}
+
+def get_glue_client(profile_name='test-prod'):
+    """Return a shared Glue client for the given profile"""
+    if profile_name not in _GLUE_CLIENTS:
+        session = boto3.Session(profile_name=profile_name)
+        _GLUE_CLIENTS[profile_name] = session.client(
+            'glue',
+            region_name='us-east-1',
+            config=Config(
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+                connect_timeout=5,
+                read_timeout=65,
+                # The concurrent job/crawler waiters all poll through this one
+                # client; a sized pool lets them reuse warm TLS connections
+                # instead of opening a new session per thread
+                max_pool_connections=16
+            )
+        )
+    return _GLUE_CLIENTS[profile_name]
+
+def run_glue_job(job_name, profile_name='test-prod'):
+    """Start a Glue job and return the job run ID"""
+
+    glue_client = get_glue_client(profile_name)
+
+    try:
+        response = glue_client.start_job_run(JobName=job_name)
+        job_run_id = response['JobRunId']
+        print(f"✅ Started Glue job: {job_name}")
+        print(f"📋 Job Run ID: {job_run_id}")
+        return job_run_id
+    except Exception as e:
+        print(f"❌ Failed to start job {job_name}: {str(e)}")
+        return None
+
+# Boto3 ships no built-in waiter for Glue job runs, so define one - botocore
+# then owns the polling cadence, throttling retries and jitter natively
+_JOB_RUN_WAITER_MODEL = WaiterModel({
+    "version": 2,
+    "waiters": {
+        "JobRunCompleted": {
+            "operation": "GetJobRun",
+            "delay": 15,
+            "maxAttempts": 240,
+            "acceptors": [
+                {"state": "success", "matcher": "path",
+                 "argument": "JobRun.JobRunState", "expected": "SUCCEEDED"},
+                {"state": "failure", "matcher": "path",
+                 "argument": "JobRun.JobRunState", "expected": "FAILED"},
+                {"state": "failure", "matcher": "path",
+                 "argument": "JobRun.JobRunState", "expected": "STOPPED"},
+                {"state": "failure", "matcher": "path",
+                 "argument": "JobRun.JobRunState", "expected": "TIMEOUT"},
+            ],
+        }
+    },
+})
+
+def monitor_job(job_name, job_run_id, profile_name='test-prod'):
+    """Monitor a Glue job until completion"""
+
+    glue_client = get_glue_client(profile_name)
+
+    print(f"🔍 Monitoring job: {job_name} (Run ID: {job_run_id})")
+
+    waiter = create_waiter_with_client('JobRunCompleted', _JOB_RUN_WAITER_MODEL, glue_client)
+    try:
+        waiter.wait(JobName=job_name, RunId=job_run_id)
+    except WaiterError:
+        # Terminal failure states (and exhausted attempts) land here; the
+        # final get_job_run below reports what actually happened
+        pass
+
+    try:
+        response = glue_client.get_job_run(JobName=job_name, RunId=job_run_id)
+        job_run = response['JobRun']
+        job_state = job_run['JobRunState']
+    except Exception as e:
+        print(f"❌ Error monitoring job: {str(e)}")
+        return False
+
+    print(f"📊 Job Status: {job_state}")
+
+    # Print final status and metrics
+    if job_state == 'SUCCEEDED':
+        print(f"✅ Job {job_name} completed successfully!")
+
+        # Print execution metrics
+        if 'ExecutionTime' in job_run:
+            execution_time = job_run['ExecutionTime']
+            print(f"⏱️  Execution Time: {execution_time} seconds")
+
+        if 'MaxCapacity' in job_run:
+            max_capacity = job_run['MaxCapacity']
+            print(f"💻 DPU Usage: {max_capacity}")
+
+    else:
+        print(f"❌ Job {job_name} failed with status: {job_state}")
+        if 'ErrorMessage' in job_run:
+            print(f"💥 Error: {job_run['ErrorMessage']}")
+
+    return job_state == 'SUCCEEDED'
+
+def monitor_jobs(job_runs, profile_name='test-prod'):
+    """Monitor several job runs concurrently; return True if all succeeded"""
+
+    if not job_runs:
+        return False
+
+    all_succeeded = True
+    with ThreadPoolExecutor(max_workers=len(job_runs)) as executor:
+        futures = {
+            executor.submit(monitor_job, job_name, job_run_id, profile_name): job_name
+            for job_name, job_run_id in job_runs
+        }
+        for future in as_completed(futures):
+            if not future.result():
+                all_succeeded = False
+
+    return all_succeeded
+
+def start_jobs(jobs_to_run, profile_name='test-prod'):
+    """Start several Glue jobs concurrently; return (job_name, run_id) pairs"""
+
+    with ThreadPoolExecutor(max_workers=len(jobs_to_run)) as executor:
+        run_ids = executor.map(lambda jn: run_glue_job(jn, profile_name), jobs_to_run)
+        return [(job_name, run_id)
+                for job_name, run_id in zip(jobs_to_run, run_ids)
+                if run_id]
+
+def run_crawler(crawler_name, profile_name='test-prod'):
+    """Start a Glue crawler and return the crawler run ID"""
+    
+    glue_client = get_glue_client(profile_name)
+
+    try:
+        response = glue_client.start_crawler(Name=crawler_name)
+        print(f"✅ Started Glue crawler: {crawler_name}")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to start crawler {crawler_name}: {str(e)}")
+        return False
+
+_CRAWLER_READY_WAITER_MODEL = WaiterModel({
+    "version": 2,
+    "waiters": {
+        "CrawlerReady": {
+            "operation": "GetCrawler",
+            "delay": 10,
+            "maxAttempts": 180,
+            "acceptors": [
+                {"state": "success", "matcher": "path",
+                 "argument": "Crawler.State", "expected": "READY"},
+            ],
+        }
+    },
+})
+
+def monitor_crawler(crawler_name, profile_name='test-prod'):
+    """Monitor a Glue crawler until completion"""
+
+    glue_client = get_glue_client(profile_name)
+
+    print(f"🔍 Monitoring crawler: {crawler_name}")
+
+    # Same waiter pattern as monitor_job (no built-in crawler waiter either)
+    waiter = create_waiter_with_client('CrawlerReady', _CRAWLER_READY_WAITER_MODEL, glue_client)
+    try:
+        waiter.wait(Name=crawler_name)
+    except WaiterError:
+        pass
+
+    try:
+        response = glue_client.get_crawler(Name=crawler_name)
+        crawler = response['Crawler']
+        crawler_state = crawler['State']
+    except Exception as e:
+        print(f"❌ Error monitoring crawler: {str(e)}")
+        return False
+
+    print(f"📊 Crawler Status: {crawler_state}")
+
+    # Print final status
+    if crawler_state == 'READY':
+        print(f"✅ Crawler {crawler_name} completed successfully!")
+
+        # Show tables created/updated
+        if 'LastCrawl' in crawler:
+            last_crawl = crawler['LastCrawl']
+            if 'Status' in last_crawl:
+                print(f"📈 Last crawl status: {last_crawl['Status']}")
+            if 'TablesCreated' in last_crawl:
+                print(f"📋 Tables created: {last_crawl['TablesCreated']}")
+            if 'TablesUpdated' in last_crawl:
+                print(f"🔄 Tables updated: {last_crawl['TablesUpdated']}")
+    else:
+        print(f"❌ Crawler {crawler_name} ended with status: {crawler_state}")
+
+    return crawler_state == 'READY'
+
+def list_glue_jobs(profile_name='test-prod'):
+    """List all available Glue jobs"""
+    
+    glue_client = get_glue_client(profile_name)
+
+    try:
+        print("📋 Available Glue Jobs:")
+        print("-" * 40)
+        # Paginate - a single get_jobs call silently truncates past 100 jobs
+        paginator = glue_client.get_paginator('get_jobs')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            for job in page['Jobs']:
+                job_name = job['Name']
+                job_role = job['Role']
+                created_on = job['CreatedOn'].strftime('%Y-%m-%d %H:%M:%S')
+                print(f"• {job_name}")
+                print(f"  Role: {job_role}")
+                print(f"  Created: {created_on}")
+                print()
+
+    except Exception as e:
+        print(f"❌ Error listing jobs: {str(e)}")
+
+def reset_job_bookmark(job_name, profile_name='test-prod'):
+    """Reset Glue job bookmark to clear saved state"""
+    
+    glue_client = get_glue_client(profile_name)
+
+    try:
+        response = glue_client.reset_job_bookmark(JobName=job_name)
+        print(f"✅ Reset job bookmark for: {job_name}")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to reset bookmark for {job_name}: {str(e)}")
+        return False
+
+def reset_all_bookmarks(profile_name='test-prod'):
+    """Reset bookmarks for all ETL jobs"""
+    
+    jobs = ["data-analytics-customers-etl", "data-analytics-orders-etl"]
+    all_success = True
+    
+    print("🔄 Resetting job bookmarks for all ETL jobs...")
+    for job_name in jobs:
+        success = reset_job_bookmark(job_name, profile_name)
+        if not success:
+            all_success = False
+    
+    if all_success:
+        print("✅ All job bookmarks reset successfully!")
+    else:
+        print("⚠️  Some bookmark resets failed")
+    
+    return all_success
+
+def main():
+    """Main function"""
+    
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 run_glue_jobs.py list                    # List all jobs and crawlers")
+        print("  python3 run_glue_jobs.py run <job_name>          # Run a specific job")
+        print("  python3 run_glue_jobs.py run-all                 # Run all ETL jobs")
+        print("  python3 run_glue_jobs.py run-crawler <name>      # Run a specific crawler")
+        print("  python3 run_glue_jobs.py run-pipeline            # Run ETL jobs + crawler")
+        print("  python3 run_glue_jobs.py reset-bookmark <job>    # Reset job bookmark")
+        print("  python3 run_glue_jobs.py reset-all-bookmarks     # Reset all job bookmarks")
+        print("  python3 run_glue_jobs.py monitor <job_name> <run_id>  # Monitor a job")
+        sys.exit(1)
+    
+    command = sys.argv[1]
+    
+    if command == "list":
+        list_glue_jobs()
+        
+    elif command == "run" and len(sys.argv) == 3:
+        job_name = sys.argv[2]
+        job_run_id = run_glue_job(job_name)
+        
+        if job_run_id:
+            monitor_job(job_name, job_run_id)
+            
+    elif command == "run-crawler" and len(sys.argv) == 3:
+        crawler_name = sys.argv[2]
+        if run_crawler(crawler_name):
+            monitor_crawler(crawler_name)
+            
+    elif command == "run-all":
+        # Run both ETL jobs
+        jobs_to_run = [
+            "data-analytics-customers-etl",
+            "data-analytics-orders-etl"
+        ]
+        
+        # Start all jobs concurrently
+        job_runs = start_jobs(jobs_to_run)
+        
+        # Monitor all jobs concurrently
+        all_succeeded = monitor_jobs(job_runs)
+        
+        if all_succeeded:
+            print("\n✅ All ETL jobs completed successfully!")
+        else:
+            print("\n❌ Some ETL jobs failed")
+            
+    elif command == "run-pipeline":
+        # Run complete pipeline: ETL jobs + crawler
+        print("🚀 Starting complete data pipeline...")
+        
+        # First run ETL jobs
+        jobs_to_run = [
+            "data-analytics-customers-etl",
+            "data-analytics-orders-etl"
+        ]
+        
+        # Start all jobs concurrently
+        job_runs = start_jobs(jobs_to_run)
+        
+        # Monitor all jobs concurrently
+        all_succeeded = monitor_jobs(job_runs)
+        
+        # If ETL succeeded, run crawler
+        if all_succeeded:
+            print("\n🕷️ Starting crawler to update schema...")
+            crawler_name = "data-analytics-crawler"
+            if run_crawler(crawler_name):
+                monitor_crawler(crawler_name)
+            print("\n🎉 Complete pipeline finished!")
+        else:
+            print("\n❌ ETL jobs failed, skipping crawler")
+            
+    elif command == "monitor" and len(sys.argv) == 4:
+        job_name = sys.argv[2]
+        job_run_id = sys.argv[3]
+        monitor_job(job_name, job_run_id)
+        
+    elif command == "reset-bookmark" and len(sys.argv) == 3:
+        job_name = sys.argv[2]
+        reset_job_bookmark(job_name)
+        
+    elif command == "reset-all-bookmarks":
+        reset_all_bookmarks()
+        
+    else:
+        print("❌ Invalid command or arguments")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,10 @@
 Script to simulate incremental data updates for testing ETL pipeline
 """
 
+import io
+import numpy as np
 import psycopg2
+from psycopg2.extras import execute_values
 import sys
 import random
 from datetime import datetime, timedelta
@@ -41,22 +44,20 @@ def add_new_customers(connection, count=5):
         ('Sophia Davis', 'sophia.davis@email.com')
     ]
     
+    # One batched INSERT instead of a round-trip per customer; ON CONFLICT
+    # still skips emails that already exist and rowcount reports what landed
     added_count = 0
-    for i in range(min(count, len(new_customers))):
-        name, email = new_customers[i]
-        try:
-            cursor.execute("""
-                INSERT INTO customers (name, email) VALUES (%s, %s)
-                ON CONFLICT (email) DO NOTHING
-            """, (name, email))
-            
-            if cursor.rowcount > 0:
-                added_count += 1
-                
-        except Exception as e:
-            print(f"⚠️  Error adding customer {name}: {e}")
-    
-    connection.commit()
+    try:
+        execute_values(
+            cursor,
+            "INSERT INTO customers (name, email) VALUES %s ON CONFLICT (email) DO NOTHING",
+            new_customers[:count],
+            page_size=1000
+        )
+        added_count = cursor.rowcount
+    except Exception as e:
+        print(f"⚠️  Error adding customers: {e}")
+
     cursor.close()
     print(f"➕ Added {added_count} new customers")
     return added_count
@@ -66,26 +67,49 @@ def update_existing_customers(connection, count=3):
     cursor = connection.cursor()
     
     try:
-        # Get some existing customer IDs
-        cursor.execute("SELECT customer_id, name, email FROM customers ORDER BY RANDOM() LIMIT %s", (count,))
+        # Sample by primary-key range instead of ORDER BY RANDOM(), which
+        # scans and sorts the whole table for a handful of rows. MIN/MAX are
+        # index-only lookups and = ANY() probes the ids directly; over-sample
+        # 3x to ride out gaps left by conflicts or deletes.
+        cursor.execute("SELECT MIN(customer_id), MAX(customer_id) FROM customers")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            print("⚠️  No customers found, nothing to update")
+            return 0
+
+        candidate_ids = random.sample(
+            range(min_id, max_id + 1),
+            min(count * 3, max_id - min_id + 1)
+        )
+        cursor.execute(
+            "SELECT customer_id, name, email FROM customers WHERE customer_id = ANY(%s) LIMIT %s",
+            (candidate_ids, count)
+        )
         customers = cursor.fetchall()
         
-        updated_count = 0
+        updates = []
         for customer_id, old_name, email in customers:
             # Update customer name (simulate profile update)
             new_name = f"{old_name} (Updated)"
-            
-            cursor.execute("""
-                UPDATE customers 
-                SET name = %s, updated_at = CURRENT_TIMESTAMP 
-                WHERE customer_id = %s
-            """, (new_name, customer_id))
-            
-            if cursor.rowcount > 0:
-                updated_count += 1
-                print(f"🔄 Updated customer: {old_name} -> {new_name}")
-        
-        connection.commit()
+            updates.append((customer_id, new_name))
+            print(f"🔄 Updating customer: {old_name} -> {new_name}")
+
+        # Fold the per-row UPDATEs into one statement joined against a
+        # VALUES list - a single round-trip however many rows change
+        updated_count = 0
+        if updates:
+            execute_values(
+                cursor,
+                """
+                UPDATE customers
+                SET name = data.new_name, updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS data (customer_id, new_name)
+                WHERE customers.customer_id = data.customer_id
+                """,
+                updates
+            )
+            updated_count = cursor.rowcount
+
         print(f"✏️  Updated {updated_count} existing customers")
         return updated_count
         
@@ -125,32 +149,38 @@ def add_new_orders(connection, count=10):
         ('Wireless Charger', 39.99)
     ]
     
+    # Vectorized generation like load_data.py - one RNG call per column
+    # instead of four random.* calls (and a round()) per order
+    rng = np.random.default_rng()
+    cids = rng.choice(np.array(customer_ids), count)
+    product_idx = rng.integers(0, len(products), count)
+    quantities = rng.integers(1, 4, count)
+    product_names = np.array([name for name, _ in products])
+    base_prices = np.array([price for _, price in products])
+    # Add some price variation
+    prices = np.round(base_prices[product_idx] * rng.uniform(0.95, 1.05, count), 2)
+    # Random order date (last 3 days)
+    today = datetime.now().date()
+    order_dates = [today - timedelta(days=int(d)) for d in rng.integers(0, 4, count)]
+
+    # COPY streams the batch past the SQL parser entirely, same as
+    # load_data.py; %-formatting also coerces the NumPy scalars for free
+    order_buf = io.StringIO()
+    for row in zip(cids, product_names[product_idx], quantities, prices, order_dates):
+        order_buf.write("%d\t%s\t%d\t%.2f\t%s\n" % row)
+
     added_count = 0
-    for _ in range(count):
-        customer_id = random.choice(customer_ids)
-        product_name, base_price = random.choice(products)
-        quantity = random.randint(1, 3)
-        
-        # Add some price variation
-        price_variation = random.uniform(0.95, 1.05)
-        price = round(base_price * price_variation, 2)
-        
-        # Random order date (last 3 days)
-        days_ago = random.randint(0, 3)
-        order_date = datetime.now().date() - timedelta(days=days_ago)
-        
-        try:
-            cursor.execute("""
-                INSERT INTO orders (customer_id, product_name, quantity, price, order_date)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (customer_id, product_name, quantity, price, order_date))
-            
-            added_count += 1
-            
-        except Exception as e:
-            print(f"⚠️  Error adding order: {e}")
-    
-    connection.commit()
+    try:
+        order_buf.seek(0)
+        cursor.copy_expert(
+            "COPY orders (customer_id, product_name, quantity, price, order_date) "
+            "FROM STDIN WITH (FORMAT text)",
+            order_buf
+        )
+        added_count = cursor.rowcount
+    except Exception as e:
+        print(f"⚠️  Error adding orders: {e}")
+
     cursor.close()
     print(f"🛒 Added {added_count} new orders")
     return added_count
@@ -160,34 +190,55 @@ def update_existing_orders(connection, count=5):
     cursor = connection.cursor()
     
     try:
-        # Get some recent orders
+        # Same id-range sampling as update_existing_customers - recent orders
+        # sit at the top of the serial order_id range, so bounding MIN/MAX by
+        # the date window keeps the sample recent without sorting the table
         cursor.execute("""
-            SELECT order_id, product_name, quantity, price 
-            FROM orders 
+            SELECT MIN(order_id), MAX(order_id) FROM orders
             WHERE order_date >= CURRENT_DATE - INTERVAL '7 days'
-            ORDER BY RANDOM() 
+        """)
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            print("⚠️  No recent orders found, nothing to update")
+            return 0
+
+        candidate_ids = random.sample(
+            range(min_id, max_id + 1),
+            min(count * 3, max_id - min_id + 1)
+        )
+        cursor.execute("""
+            SELECT order_id, product_name, quantity, price
+            FROM orders
+            WHERE order_id = ANY(%s)
+              AND order_date >= CURRENT_DATE - INTERVAL '7 days'
             LIMIT %s
-        """, (count,))
+        """, (candidate_ids, count))
         orders = cursor.fetchall()
         
-        updated_count = 0
+        updates = []
         for order_id, product_name, old_quantity, old_price in orders:
             # Simulate quantity or price updates
             new_quantity = max(1, old_quantity + random.randint(-1, 2))
             price_change = random.uniform(0.9, 1.1)
             new_price = round(old_price * price_change, 2)
-            
-            cursor.execute("""
-                UPDATE orders 
-                SET quantity = %s, price = %s, updated_at = CURRENT_TIMESTAMP 
-                WHERE order_id = %s
-            """, (new_quantity, new_price, order_id))
-            
-            if cursor.rowcount > 0:
-                updated_count += 1
-                print(f"📝 Updated order {order_id}: {product_name} qty:{old_quantity}->{new_quantity} price:${old_price}->${new_price}")
-        
-        connection.commit()
+            updates.append((order_id, new_quantity, new_price))
+            print(f"📝 Updating order {order_id}: {product_name} qty:{old_quantity}->{new_quantity} price:${old_price}->${new_price}")
+
+        # Same VALUES-join batching as update_existing_customers
+        updated_count = 0
+        if updates:
+            execute_values(
+                cursor,
+                """
+                UPDATE orders
+                SET quantity = data.quantity, price = data.price, updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS data (order_id, quantity, price)
+                WHERE orders.order_id = data.order_id
+                """,
+                updates
+            )
+            updated_count = cursor.rowcount
+
         print(f"📋 Updated {updated_count} existing orders")
         return updated_count
         
@@ -205,40 +256,44 @@ def show_recent_changes(connection):
     print("=" * 50)
     
     try:
-        # Recent customers
+        # One round-trip: both counts and the latest-changes sample come back
+        # as a single JSON document instead of three separate queries
         cursor.execute("""
-            SELECT COUNT(*) FROM customers 
-            WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
-               OR updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+            WITH recent_customers AS (
+                SELECT COUNT(*) AS n FROM customers
+                WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+                   OR updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+            ),
+            recent_orders AS (
+                SELECT COUNT(*) AS n FROM orders
+                WHERE order_date >= CURRENT_DATE - INTERVAL '1 day'
+                   OR updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+            ),
+            latest AS (
+                SELECT name, email,
+                       CASE WHEN updated_at > created_at THEN 'UPDATED' ELSE 'NEW' END AS status,
+                       updated_at
+                FROM customers
+                WHERE updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+                ORDER BY updated_at DESC
+                LIMIT 5
+            )
+            SELECT json_build_object(
+                'recent_customers', (SELECT n FROM recent_customers),
+                'recent_orders', (SELECT n FROM recent_orders),
+                'latest', (SELECT COALESCE(json_agg(latest), '[]'::json) FROM latest)
+            )
         """)
-        recent_customers = cursor.fetchone()[0]
-        
-        # Recent orders  
-        cursor.execute("""
-            SELECT COUNT(*) FROM orders 
-            WHERE order_date >= CURRENT_DATE - INTERVAL '1 day'
-               OR updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
-        """)
-        recent_orders = cursor.fetchone()[0]
-        
-        print(f"🧑‍🤝‍🧑 Customers modified in last hour: {recent_customers}")
-        print(f"🛍️  Orders from last day or modified in last hour: {recent_orders}")
-        
-        # Show latest updates
-        cursor.execute("""
-            SELECT name, email, 
-                   CASE WHEN updated_at > created_at THEN 'UPDATED' ELSE 'NEW' END as status,
-                   updated_at
-            FROM customers 
-            WHERE updated_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
-            ORDER BY updated_at DESC
-            LIMIT 5
-        """)
-        
+        summary = cursor.fetchone()[0]
+
+        print(f"🧑‍🤝‍🧑 Customers modified in last hour: {summary['recent_customers']}")
+        print(f"🛍️  Orders from last day or modified in last hour: {summary['recent_orders']}")
+
         print(f"\n🔄 Latest Customer Changes:")
-        for name, email, status, updated_at in cursor.fetchall():
-            print(f"  • {name} ({email}) - {status} at {updated_at}")
-            
+        for change in summary['latest']:
+            print(f"  • {change['name']} ({change['email']}) - {change['status']} at {change['updated_at']}")
+
+
     except Exception as e:
         print(f"❌ Error showing recent changes: {e}")
     finally:
@@ -278,11 +333,18 @@ def main():
             
             # Show summary
             show_recent_changes(connection)
-            
+
+            # One commit for the whole simulation - each helper used to pay
+            # its own WAL fsync for a handful of rows
+            connection.commit()
+
             print(f"\n✅ Incremental data simulation completed!")
             print(f"💡 You can now run the Glue ETL jobs to test incremental processing:")
             print(f"   python3 run_glue_jobs.py run-all")
-            
+
+        except Exception as e:
+            connection.rollback()
+            print(f"❌ Simulation failed, rolled back: {e}")
         finally:
             connection.close()
     else: